@@ -21,20 +21,96 @@
 # Ultra-compat version: forces byte house code, guards all tuple shapes, never indexes blindly.
 # Drop in as app.py
 
-from datetime import datetime
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 from dateutil import tz
+from functools import lru_cache
 from fastapi import FastAPI, HTTPException, Header
-from pydantic import BaseModel, Field, field_validator
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 from typing import Optional
+from zoneinfo import ZoneInfo
+import numpy as np
 import swisseph as swe
+import gc
+import math
 import os
+import re
+import threading
 
 # ---- Config / Secrets
 API_KEY = os.getenv("API_KEY")
 EPHE_PATH = os.getenv("EPHE_PATH", ".")
-swe.set_ephe_path(EPHE_PATH)
+NATAL_CACHE_SIZE = int(os.getenv("NATAL_CACHE_SIZE", "4096"))  # 0 disables response caching
 
-app = FastAPI(title="Natal Chart API", version="1.0.8-no-birth-time")
+# pyswisseph keeps its settings per thread, and sync endpoints run in a threadpool,
+# so the ephemeris path has to be applied in every thread that calls into it.
+_swe_thread = threading.local()
+
+
+def _swe_thread_setup():
+    if not getattr(_swe_thread, "ready", False):
+        swe.set_ephe_path(EPHE_PATH)
+        _swe_thread.ready = True
+
+
+_swe_thread_setup()
+
+J2000 = 2451545.0  # 2000-01-01 12:00 UT
+
+
+def _probe_calc_flags():
+    """FLG_SWIEPH if the .se1 files under EPHE_PATH are usable, else FLG_MOSEPH.
+
+    Without the files Swiss Ephemeris silently falls back to Moshier on every call
+    (after searching the path again), so we detect that from the returned flag once.
+    """
+    try:
+        _, retflag = swe.calc_ut(J2000, swe.SUN, swe.FLG_SWIEPH)
+        if retflag & swe.FLG_SWIEPH:
+            return swe.FLG_SWIEPH
+    except Exception:
+        pass
+    return swe.FLG_MOSEPH
+
+
+# Ephemeris flags used by swe_calc_body, settled once at import (speeds are reported)
+_CALC_FLAGS = _probe_calc_flags() | swe.FLG_SPEED
+
+
+def _warm_ephemeris():
+    """Touch every ephemeris file once so the first real request doesn't pay for opening them."""
+    _swe_thread_setup()
+    for planet_id in _CALC_IDS.tolist():
+        try:
+            swe.calc_ut(J2000, planet_id, _CALC_FLAGS)
+        except Exception:
+            pass  # reported per body by swe_calc_many() on real requests
+    try:
+        swe.houses(J2000, 0.0, 0.0, HSYS_CHAR["Placidus"])
+    except Exception:
+        pass
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync endpoints run in the threadpool and pyswisseph's open files are per thread,
+    # so warm up there; an idle worker is reused first, so this is the one the next
+    # request lands on.
+    await run_in_threadpool(_warm_ephemeris)
+    # Everything alive now (modules, lookup tables, the app and its routes) lives for the
+    # whole process; keep it out of the collector's scans so request garbage is all it sees
+    gc.collect()
+    gc.freeze()
+    yield
+
+
+app = FastAPI(
+    title="Natal Chart API", version="1.0.8-no-birth-time",
+    lifespan=lifespan, default_response_class=ORJSONResponse,
+)
 
 # ---- House codes (Swiss Ephemeris expects a 1-byte code)
 HSYS_CHAR = {
@@ -47,11 +123,19 @@ HSYS_CHAR = {
     "Equal":         b"E",
     "WholeSign":     b"W",
 }
-
-SIGNS = [
+# Accepted house_system spellings -> canonical HSYS_CHAR key, so validation of the
+# usual inputs is a single dict hit; every spelling is also accepted in lowercase
+_HSYS_CANON = {key: key for key in HSYS_CHAR}
+_HSYS_CANON.update({
+    "Whole Sign": "WholeSign", "Whole-Sign": "WholeSign", "Equal House": "Equal",
+})
+_HSYS_CANON.update({alias.lower(): key for alias, key in list(_HSYS_CANON.items())})
+_HSYS_ERROR = "house_system must be one of: " + ", ".join(HSYS_CHAR.keys())
+
+SIGNS = (
     "Aries","Taurus","Gemini","Cancer","Leo","Virgo",
     "Libra","Scorpio","Sagittarius","Capricorn","Aquarius","Pisces"
-]
+)
 
 PLANET_LABELS = [
     "Sun","Moon","Mercury","Venus","Mars","Jupiter","Saturn","Uranus","Neptune","Pluto"
@@ -61,6 +145,12 @@ SWE_IDS = {
     "Mars": swe.MARS, "Jupiter": swe.JUPITER, "Saturn": swe.SATURN,
     "Uranus": swe.URANUS, "Neptune": swe.NEPTUNE, "Pluto": swe.PLUTO,
 }
+# Mean Node if available, else True Node; the South Node is derived from it
+_NODE_ID = getattr(swe, "MEAN_NODE", getattr(swe, "TRUE_NODE"))
+# One ephemeris batch per chart: the planets in PLANET_LABELS order, then the North Node
+_CALC_IDS = np.array([SWE_IDS[label] for label in PLANET_LABELS] + [_NODE_ID], dtype=np.int32)
+BODY_NAMES = tuple(PLANET_LABELS) + ("North Node", "South Node")
+N_PLANETS = len(PLANET_LABELS)
 ASPECTS = [
     ("conjunction", 0,   8),
     ("opposition",  180, 8),
@@ -68,6 +158,10 @@ ASPECTS = [
     ("square",      90,  6),
     ("sextile",     60,  5),
 ]
+# Same table as parallel arrays for the vectorized aspect kernel
+_ASPECT_NAMES  = tuple(name for name, _, _ in ASPECTS)
+_ASPECT_EXACTS = np.array([exact for _, exact, _ in ASPECTS], dtype=np.float64)
+_ASPECT_ORBS   = np.array([orb for _, _, orb in ASPECTS], dtype=np.float64)
 
 class NatalInput(BaseModel):
     date: str = Field(..., example="1990-06-12")
@@ -77,28 +171,71 @@ class NatalInput(BaseModel):
     latitude: float
     longitude: float
     house_system: Optional[str] = Field(default="Placidus")
+    # Swiss Ephemeris 1-byte house code, resolved once at validation time
+    _hsys_byte: bytes = PrivateAttr(default=b"P")
 
     @field_validator("house_system")
     @classmethod
     def valid_house(cls, v):
-        key = str(v).strip()
-        if key not in HSYS_CHAR:
-            raise ValueError("house_system must be one of: " + ", ".join(HSYS_CHAR.keys()))
+        key = _HSYS_CANON.get(v)
+        if key is None:  # only unusual input pays for string normalization
+            key = _HSYS_CANON.get(str(v).strip().lower())
+            if key is None:
+                raise ValueError(_HSYS_ERROR)
         return key
 
+    @model_validator(mode="after")
+    def resolve_house_byte(self):
+        self._hsys_byte = HSYS_CHAR[self.house_system]
+        return self
+
 
 def lon_to_sign_deg(lon: float):
-    lon = lon % 360.0
-    sign_index = int(lon // 30)
-    deg_in_sign = lon - sign_index * 30
-    return SIGNS[sign_index], round(deg_in_sign, 2)
+    sign_index, deg_in_sign = divmod(lon % 360.0, 30.0)
+    return SIGNS[int(sign_index)], round(deg_in_sign, 2)
 
 
-def to_utc_iso(date_str: str, time_str: Optional[str], tzname: str):
-    """Return (utc_dt, utc_iso, approx_time). If time_str is missing/blank, assume 12:00 local."""
+def lons_to_signs(lons):
+    """Vectorized lon_to_sign_deg(): (sign names, 2-dp degree array) for lons already in [0, 360).
+
+    NaN entries get a placeholder sign and a NaN degree; callers skip those rows.
+    """
+    idx = (np.nan_to_num(lons) // 30.0).astype(np.intp)
+    return [SIGNS[i] for i in idx.tolist()], np.round(lons - idx * 30.0, 2)
+
+
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=1024)  # room for every IANA zone name plus common aliases
+def _get_tz(tzname: str):
+    """Cached timezone lookup; zoneinfo files are only read once per IANA name.
+
+    Prefers stdlib zoneinfo (full 64-bit transition data, so offsets before 1901 and
+    after 2037 are right; the pinned tzdata package stands in for a missing system tz
+    database); anything it can't resolve (POSIX strings like 'GMT+3') goes to dateutil.
+    """
+    try:
+        return ZoneInfo(tzname)
+    except (KeyError, ValueError, OSError):  # ZoneInfoNotFoundError is a KeyError
+        pass
     local_tz = tz.gettz(tzname)
     if not local_tz:
         raise ValueError("Invalid timezone string. Use IANA, e.g., 'America/New_York'.")
+    return local_tz
+
+
+# The shapes strptime("%Y-%m-%d %H:%M") accepted on f"{date} {time}" (4-digit year, 1-2
+# digit fields, a space-padded day, whitespace after the date), except that digits must be
+# ASCII; strptime also took other Unicode digits
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2}| \d)", re.ASCII)
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{1,2})", re.ASCII)
+_DATETIME_ERROR = "time must be HH:MM in 24h format (e.g., '09:30' or '18:05')"
+
+
+def to_utc_iso(date_str: str, time_str: Optional[str], tzname: str):
+    """Return (utc_dt, utc_iso, approx_time). If time_str is missing/blank, assume 12:00 local."""
+    local_tz = _get_tz(tzname)
 
     approx_time = False
     t = (time_str or "").strip() if time_str is not None else ""
@@ -106,36 +243,259 @@ def to_utc_iso(date_str: str, time_str: Optional[str], tzname: str):
         t = "12:00"  # assume local noon when birth time is unknown
         approx_time = True
 
-    # basic HH:MM sanity; if not valid, raise 400
+    # basic YYYY-MM-DD / HH:MM sanity without strptime; if not valid, raise 400
+    date_m = _DATE_RE.fullmatch(date_str.rstrip())
+    time_m = _TIME_RE.fullmatch(t)
+    if date_m is None or time_m is None:
+        raise ValueError(_DATETIME_ERROR)
+    y, mo, d = date_m.groups()
+    hh, mm = time_m.groups()
     try:
-        naive = datetime.strptime(f"{date_str} {t}", "%Y-%m-%d %H:%M")
+        local_dt = datetime(int(y), int(mo), int(d), int(hh), int(mm), tzinfo=local_tz)
     except ValueError:
-        raise ValueError("time must be HH:MM in 24h format (e.g., '09:30' or '18:05')")
+        raise ValueError(_DATETIME_ERROR)
 
-    local_dt = naive.replace(tzinfo=local_tz)
-    utc_dt = local_dt.astimezone(tz.UTC)
-    return utc_dt, utc_dt.strftime("%Y-%m-%dT%H:%M:%SZ"), approx_time
+    utc_dt = local_dt.astimezone(_UTC)
+    utc_iso = (f"{utc_dt.year:04d}-{utc_dt.month:02d}-{utc_dt.day:02d}"
+               f"T{utc_dt.hour:02d}:{utc_dt.minute:02d}:{utc_dt.second:02d}Z")
+    return utc_dt, utc_iso, approx_time
 
 
-def swe_calc_lonlat(jdut: float, planet_id: int):
-    def ok(x):
-        return isinstance(x, (list, tuple)) and len(x) >= 2
-    try:
-        vals, _ = swe.calc_ut(jdut, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-        if ok(vals):
-            return vals[0] % 360.0, vals[1]
-    except Exception:
-        pass
-    try:
-        vals, _ = swe.calc_ut(jdut, planet_id, swe.FLG_SWIEPH)
-        if ok(vals):
-            return vals[0] % 360.0, vals[1]
-    except Exception:
-        pass
-    vals, _ = swe.calc_ut(jdut, planet_id, swe.FLG_MOSEPH)
-    if not ok(vals):
+def swe_calc_body(jdut: float, planet_id: int):
+    """(lon, lat, lon speed/day) as returned by Swiss Ephemeris; lon is not re-normalized here."""
+    # No per-call fallback: for dates or bodies outside the loaded files Swiss Ephemeris
+    # already switches to Moshier internally, and a genuine error is reported per body
+    # by swe_calc_many(). Results are memoized per instant by _body_positions().
+    vals, _ = swe.calc_ut(jdut, planet_id, _CALC_FLAGS)
+    if not (isinstance(vals, (list, tuple)) and len(vals) >= 4):
         raise RuntimeError(f"pyswisseph returned invalid tuple for planet id {planet_id}")
-    return vals[0] % 360.0, vals[1]
+    return vals[0], vals[1], vals[3]
+
+
+@lru_cache(maxsize=None)
+def _pair_indices(n: int):
+    """Upper-triangle (i, j) index arrays for n bodies, built once per n."""
+    pair_i, pair_j = np.triu_indices(n, 1)
+    pair_i.flags.writeable = False
+    pair_j.flags.writeable = False
+    return pair_i, pair_j
+
+
+_aspect_scratch = threading.local()
+
+
+def _aspect_buffers(n_pairs: int, n_aspects: int):
+    """Per-thread scratch arrays for _find_aspects(), reused across requests."""
+    bufs = getattr(_aspect_scratch, "bufs", None)
+    if bufs is None:
+        bufs = _aspect_scratch.bufs = {}
+    key = (n_pairs, n_aspects)
+    if key not in bufs:
+        bufs[key] = (np.empty(n_pairs), np.empty(n_pairs), np.empty((n_pairs, n_aspects)))
+    return bufs[key]
+
+
+def _find_aspects(lons, exacts, orbs):
+    """Pure-array aspect kernel over longitudes in [0, 360).
+
+    Returns parallel arrays (i, j, aspect_index, orb, dist) for every pair i<j within
+    orb of some aspect, in pair order. Each pair is tested only against its closest
+    aspect angle; the ASPECTS orbs don't overlap, so that is the only one it can match.
+    Intermediates live in per-thread scratch buffers; the returned arrays are fresh.
+    """
+    pair_i, pair_j = _pair_indices(len(lons))
+    dist, other, diff = _aspect_buffers(len(pair_i), len(exacts))
+    np.take(lons, pair_i, out=dist)
+    np.take(lons, pair_j, out=other)
+    np.subtract(dist, other, out=dist)
+    np.abs(dist, out=dist)
+    np.subtract(360.0, dist, out=other)
+    np.minimum(dist, other, out=dist)
+    np.subtract(dist[:, None], exacts[None, :], out=diff)
+    np.abs(diff, out=diff)
+    best = diff.argmin(axis=1)
+    best_diff = np.take_along_axis(diff, best[:, None], axis=1)[:, 0]
+    rows = np.flatnonzero(best_diff <= orbs[best])
+    return pair_i[rows], pair_j[rows], best[rows], best_diff[rows], dist[rows]
+
+
+def swe_calc_many(jdut: float, planet_ids):
+    """Return ((N, 3) lon/lat/speed array, {row: error}) for a batch of bodies; failed rows stay NaN."""
+    out = np.full((len(planet_ids), 3), np.nan)
+    errors = {}
+    for row, planet_id in enumerate(np.asarray(planet_ids).tolist()):
+        try:
+            out[row] = swe_calc_body(jdut, planet_id)
+        except Exception as e:
+            errors[row] = e
+    return out, errors
+
+
+class _LRUCache:
+    """Thread-safe LRU map. Unlike lru_cache, the caller decides what gets stored, so results
+    with failed bodies (possibly transient, e.g. a file-open error under load) are not kept.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+_POSITIONS_CACHE = _LRUCache(8192)
+_NATAL_CACHE = _LRUCache(NATAL_CACHE_SIZE)
+
+
+def _body_positions(jd_key: int):
+    """Body longitudes/latitudes for jd_key = round(jdut * 86400), i.e. 1-second resolution.
+
+    Returns read-only (lons, lats, speeds) arrays in BODY_NAMES order, {row: error message}
+    for planets that failed, and a complete flag; rows that could not be computed are NaN.
+    Only complete results (no body failed, node included) are memoized.
+    """
+    cached = _POSITIONS_CACHE.get(jd_key)
+    if cached is not None:
+        return cached
+
+    jdut = jd_key / 86400.0
+    lons = np.full(len(BODY_NAMES), np.nan)
+    lats = np.zeros(len(BODY_NAMES))
+    speeds = np.zeros(len(BODY_NAMES))
+    positions, failures = swe_calc_many(jdut, _CALC_IDS)
+    lons[:N_PLANETS + 1] = positions[:, 0]
+    lats[:N_PLANETS] = positions[:N_PLANETS, 1]
+    speeds[:N_PLANETS + 1] = positions[:, 2]
+    # Nodes are reported with lat 0 and the South Node moves with the North Node; a failed
+    # node stays NaN and is left out of the response rather than reported as an error
+    lons[N_PLANETS + 1] = lons[N_PLANETS] + 180.0
+    speeds[N_PLANETS + 1] = speeds[N_PLANETS]
+    calc_errors = {row: str(e) for row, e in failures.items() if row < N_PLANETS}
+
+    # The one place longitudes are normalized to [0, 360); everything downstream relies on it
+    np.remainder(lons, 360.0, out=lons)
+
+    lons.flags.writeable = False
+    lats.flags.writeable = False
+    speeds.flags.writeable = False
+    result = (lons, lats, speeds, calc_errors, not failures)
+    if not failures:
+        _POSITIONS_CACHE.put(jd_key, result)
+    return result
+
+
+def _compute_natal(utc_dt: datetime, approx_time: bool, lat: float, lon: float, hsys: bytes):
+    """Chart body for a parsed UTC instant and location. Deterministic, so memoized.
+
+    Keyed on the instant rather than the raw date/time/timezone strings, so the same
+    moment given in different zones shares one cache entry. "meta" echoes the request
+    and is added by natal(), outside the cache. A chart with failed bodies is not
+    memoized, so the next request retries them.
+    """
+    key = (utc_dt, approx_time, lat, lon, hsys)
+    chart = _NATAL_CACHE.get(key)
+    if chart is not None:
+        return chart
+
+    _swe_thread_setup()
+    jdut = swe.julday(
+        utc_dt.year,
+        utc_dt.month,
+        utc_dt.day,
+        utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0,
+    )
+
+    # Planet/node positions depend only on the instant; shared across locations and house systems
+    jd_key = round(jdut * 86400.0)
+    lons, lats, speeds, calc_errors, complete = _body_positions(jd_key)
+
+    # Houses/angles/rising_sign only if birth time is known (not approximated)
+    houses = []
+    angles = {"ASC": None, "MC": None}
+    rising = None
+    if not approx_time:
+        cusps_raw, ascmc = swe.houses(jdut, lat, lon, hsys)
+        if not (isinstance(ascmc, (list, tuple)) and len(ascmc) >= 2):
+            raise RuntimeError("houses() did not return ASC/MC as expected")
+        asc_lon = float(ascmc[0]) % 360.0
+        mc_lon  = float(ascmc[1]) % 360.0
+
+        # Normalize cusp array defensively (some builds return a leading dummy cusp 0)
+        if isinstance(cusps_raw, (list, tuple)):
+            L = len(cusps_raw)
+            if L < 12:
+                raise RuntimeError(f"Unexpected cusps length: {L}")
+            start = 1 if L == 13 else 0
+            cusps = np.mod(np.asarray(cusps_raw[start:start+12], dtype=np.float64), 360.0)
+        else:
+            raise RuntimeError("houses() cusps not list/tuple")
+
+        cusp_signs, cusp_degs = lons_to_signs(cusps)
+        houses = [
+            {"n": n, "sign": s, "deg": d, "lon": cusp_out}
+            for n, (s, d, cusp_out) in enumerate(
+                zip(cusp_signs, cusp_degs.tolist(), np.round(cusps, 4).tolist()), 1)
+        ]
+
+        asc_sign, asc_deg = lon_to_sign_deg(asc_lon)
+        mc_sign, mc_deg   = lon_to_sign_deg(mc_lon)
+        angles = {
+            "ASC": {"name":"ASC","sign":asc_sign,"deg":asc_deg,"lon":round(asc_lon,4)},
+            "MC":  {"name":"MC","sign":mc_sign,"deg":mc_deg,"lon":round(mc_lon,4)}
+        }
+        rising = {"sign": asc_sign, "deg": asc_deg}
+
+    # Aspects from computed longitudes (independent of time for planets; moon varies but fine)
+    valid = np.flatnonzero(~np.isnan(lons))
+    names_for_aspects = [BODY_NAMES[row] for row in valid.tolist()]
+    asp_i, asp_j, asp_k, asp_orb, asp_dist = _find_aspects(lons[valid], _ASPECT_EXACTS, _ASPECT_ORBS)
+    asp_results = [
+        {
+            "a": names_for_aspects[i], "b": names_for_aspects[j], "type": _ASPECT_NAMES[k],
+            "orb": orb, "dist": dist, "exact": ASPECTS[k][1]
+        }
+        for i, j, k, orb, dist in zip(asp_i.tolist(), asp_j.tolist(), asp_k.tolist(),
+                                      np.round(asp_orb, 2).tolist(), np.round(asp_dist, 2).tolist())
+    ]
+
+    # Output rows are built last, straight from the arrays: sign, degree and rounding
+    # are each one vectorized pass. Failed planets get an error row; a failed node
+    # (NaN) is omitted silently.
+    body_signs, body_degs = lons_to_signs(lons)
+    rows = zip(BODY_NAMES, body_signs, body_degs.tolist(), np.round(lons, 4).tolist(),
+               np.round(lats, 4).tolist(), np.round(speeds, 4).tolist())
+    planets = [
+        {"name": label, "error": f"calc failed: {calc_errors[row]}"} if row in calc_errors else
+        {"name": label, "sign": sign, "deg": d, "lon": lon_out, "lat": lat_out, "speed": speed}
+        for row, (label, sign, d, lon_out, lat_out, speed) in enumerate(rows)
+        if row in calc_errors or not math.isnan(lon_out)
+    ]
+
+    chart = {
+        "angles": angles,             # None if time missing
+        "houses": houses,             # [] if time missing
+        "planets": planets,
+        "aspects": asp_results,
+        "rising_sign": rising         # None if time missing
+    }
+    if complete:
+        _NATAL_CACHE.put(key, chart)
+    return chart
 
 
 @app.post("/natal")
@@ -144,130 +504,52 @@ def natal(payload: NatalInput, x_api_key: Optional[str] = Header(default=None)):
     if API_KEY and x_api_key != API_KEY:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
+    # Input errors (bad date/time/timezone) are the client's: 400
     try:
-        # UTC & Julian Day (approx_time True if we assumed 12:00)
+        # UTC (approx_time True if we assumed 12:00)
         utc_dt, utc_iso, approx_time = to_utc_iso(payload.date, payload.time, payload.timezone)
-        jdut = swe.julday(
-            int(utc_dt.strftime("%Y")),
-            int(utc_dt.strftime("%m")),
-            int(utc_dt.strftime("%d")),
-            int(utc_dt.strftime("%H")) + int(utc_dt.strftime("%M"))/60.0,
-        )
-        lat = float(payload.latitude)
-        lon = float(payload.longitude)
-
-        # Planets (independent of houses/angles)
-        planets = []
-        body_lons = {}
-        for label in PLANET_LABELS:
-            try:
-                lon_p, lat_p = swe_calc_lonlat(jdut, SWE_IDS[label])
-                s, d = lon_to_sign_deg(lon_p)
-                body_lons[label] = lon_p
-                planets.append({
-                    "name": label, "sign": s, "deg": d,
-                    "lon": round(lon_p, 4), "lat": round(lat_p, 4), "speed": 0.0
-                })
-            except Exception as e:
-                planets.append({"name": label, "error": f"calc failed: {e}"})
-
-        # Nodes (Mean if available, else True) + South Node
-        try:
-            node_pid = getattr(swe, "MEAN_NODE", getattr(swe, "TRUE_NODE"))
-            node_lon, _ = swe_calc_lonlat(jdut, node_pid)
-            n_sign, n_deg = lon_to_sign_deg(node_lon)
-            body_lons["North Node"] = node_lon
-            planets.append({
-                "name": "North Node", "sign": n_sign, "deg": n_deg,
-                "lon": round(node_lon, 4), "lat": 0.0, "speed": 0.0
-            })
-            south_lon = (node_lon + 180.0) % 360.0
-            s_sign, s_deg = lon_to_sign_deg(south_lon)
-            body_lons["South Node"] = south_lon
-            planets.append({
-                "name": "South Node", "sign": s_sign, "deg": s_deg,
-                "lon": round(south_lon, 4), "lat": 0.0, "speed": 0.0
-            })
-        except Exception:
-            pass
-
-        # Houses/angles/rising_sign only if birth time is known (not approximated)
-        houses = []
-        angles = {"ASC": None, "MC": None}
-        rising = None
-        if not approx_time:
-            hsys = HSYS_CHAR[payload.house_system]
-            cusps_raw, ascmc = swe.houses(jdut, lat, lon, hsys)
-            if not (isinstance(ascmc, (list, tuple)) and len(ascmc) >= 2):
-                raise RuntimeError("houses() did not return ASC/MC as expected")
-            asc_lon = float(ascmc[0])
-            mc_lon  = float(ascmc[1])
-
-            # Normalize cusp array defensively
-            if isinstance(cusps_raw, (list, tuple)):
-                L = len(cusps_raw)
-                if L == 13:
-                    cusps = [float(cusps_raw[i]) for i in range(1, 13)]
-                elif L >= 12:
-                    cusps = [float(cusps_raw[i]) for i in range(0, 12)]
-                else:
-                    raise RuntimeError(f"Unexpected cusps length: {L}")
-            else:
-                raise RuntimeError("houses() cusps not list/tuple")
-
-            for i in range(12):
-                cusp_lon = cusps[i]
-                s, d = lon_to_sign_deg(cusp_lon)
-                houses.append({"n": i+1, "sign": s, "deg": d, "lon": round(cusp_lon % 360.0, 4)})
-
-            asc_sign, asc_deg = lon_to_sign_deg(asc_lon)
-            mc_sign, mc_deg   = lon_to_sign_deg(mc_lon)
-            angles = {
-                "ASC": {"name":"ASC","sign":asc_sign,"deg":asc_deg,"lon":round(asc_lon,4)},
-                "MC":  {"name":"MC","sign":mc_sign,"deg":mc_deg,"lon":round(mc_lon,4)}
-            }
-            rising = {"sign": asc_sign, "deg": asc_deg}
-
-        # Aspects from computed longitudes (independent of time for planets; moon varies but fine)
-        names_for_aspects = [n for n in PLANET_LABELS + ["North Node","South Node"] if n in body_lons]
-        asp_results = []
-        for i, na in enumerate(names_for_aspects):
-            lonA = body_lons[na] % 360.0
-            for nb in names_for_aspects[i+1:]:
-                lonB = body_lons[nb] % 360.0
-                dist = min(abs(lonA - lonB), 360.0 - abs(lonA - lonB))
-                for name, exact, orb in ASPECTS:
-                    diff = abs(dist - exact)
-                    if diff <= orb:
-                        asp_results.append({
-                            "a": na, "b": nb, "type": name,
-                            "orb": round(diff, 2), "dist": round(dist, 2), "exact": exact
-                        })
-                        break
-
-        return {
-            "meta": {
-                "house_system": payload.house_system,
-                "datetime_utc": utc_iso,
-                "time_assumed_noon": approx_time,
-                "location": {"lat": lat, "lng": lon},
-            },
-            "angles": angles,             # None if time missing
-            "houses": houses,             # [] if time missing
-            "planets": planets,
-            "aspects": asp_results,
-            "rising_sign": rising         # None if time missing
-        }
-
-    except HTTPException:
-        raise
-    except ValueError as e:
+    except (ValueError, OverflowError) as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+    # Anything failing past this point is ours: 500
+    try:
+        # Keyed on the exact coordinates: rounding them would move the house cusps
+        chart = _compute_natal(
+            utc_dt, approx_time, float(payload.latitude), float(payload.longitude),
+            payload._hsys_byte,
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation error: {e}")
 
+    # The cached chart is shared between requests; meta reports this request's own input
+    return {
+        "meta": {
+            "house_system": payload.house_system,
+            "datetime_utc": utc_iso,
+            "time_assumed_noon": approx_time,
+            "location": {"lat": float(payload.latitude), "lng": float(payload.longitude)},
+        },
+        **chart,
+    }
+
 
 @app.get("/healthz")
 def health():
     return {"ok": True}
 
+
+if __name__ == "__main__":
+    # Production launcher: "auto" picks uvloop/httptools where uvicorn[standard] installed
+    # them (not on Windows) and falls back to asyncio/h11 elsewhere. Each worker is
+    # a separate process with its own ephemeris state and caches, so CPU-bound chart
+    # work scales across cores.
+    import uvicorn
+
+    uvicorn.run(
+        "app:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        workers=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+        loop="auto",
+        http="auto",
+    )